@@ -13,8 +13,11 @@ print(f"Random float: {random_float:.3f}")
 
 normal_numbers = np.random.normal(loc=2.0, scale=0.8, size=1000)
 
-plt.hist(normal_numbers, bins=25, color='skyblue', edgecolor='navy', alpha=0.7)
-plt.axvline(np.mean(normal_numbers), color='red', linestyle='dashed', linewidth=1.5, label='Mean')
+mean_value = normal_numbers.mean()
+counts, edges = np.histogram(normal_numbers, bins=25)
+
+plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='skyblue', edgecolor='navy', alpha=0.7)
+plt.axvline(mean_value, color='red', linestyle='dashed', linewidth=1.5, label='Mean')
 
 plt.title("Modified Normal Distribution Histogram")
 plt.xlabel("Value")
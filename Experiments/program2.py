@@ -10,23 +10,21 @@ try:
     display(your_df.head())
     
     print("\nPopulation Distribution Analysis for your Dataset:")
-    for col in your_df.select_dtypes(include=np.number).columns:
-        mean_value = np.mean(your_df[col])
-        median_value = np.median(your_df[col])
-        if not your_df[col].empty:
-            mode_result = stats.mode(your_df[col])
+    numeric_df = your_df.select_dtypes(include=np.number)
+    summary = numeric_df.agg(['mean', 'median'])
+    if not numeric_df.empty:
+        mode_result = stats.mode(numeric_df.to_numpy(), axis=0, nan_policy='omit', keepdims=False)
+    else:
+        mode_result = None
+
+    for i, col in enumerate(numeric_df.columns):
+        print(f"\nFeature: {col}")
+        print(f"  Mean: {summary.at['mean', col]:.3f}")
+        print(f"  Median: {summary.at['median', col]:.3f}")
+        if mode_result is not None:
+            print(f"  Mode: {mode_result.mode[i]:.3f} (count: {int(mode_result.count[i])})")
         else:
-            mode_result = None
-            print(f"\nFeature: {col}")
-            print(f"  Mean: {mean_value:.3f}")
-            print(f"  Median: {median_value:.3f}")
-            if mode_result:
-                if isinstance(mode_result.mode, np.ndarray):
-                    print(f"  Mode: {mode_result.mode} (count: {mode_result.count})")
-                else:
-                    print(f"  Mode: {mode_result.mode:.3f} (count: {mode_result.count})")
-            else:
-                print("  Mode: Could not calculate mode for empty data.")
+            print("  Mode: Could not calculate mode for empty data.")
 
 except FileNotFoundError:
     print(f"Error: The file '{your_dataset_path}' was not found.")
@@ -1,4 +1,5 @@
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 
@@ -6,11 +7,10 @@ mall_df = pd.read_csv("/Mall_Customers.csv")
 print("Mall Customers dataset loaded successfully.")
 print(mall_df.head())
 
-X = mall_df[['Annual Income (k$)', 'Spending Score (1-100)']].values
+X = mall_df[['Annual Income (k$)', 'Spending Score (1-100)']].to_numpy(dtype=np.float32)
 
-kmeans = KMeans(n_clusters=5, random_state=0, n_init=10)
-kmeans.fit(X)
-y_kmeans = kmeans.predict(X)
+kmeans = MiniBatchKMeans(n_clusters=5, random_state=0, n_init=10, batch_size=256)
+y_kmeans = kmeans.fit_predict(X)
 
 plt.figure(figsize=(10, 7))
 plt.scatter(X[:, 0], X[:, 1], c=y_kmeans, s=50, cmap='viridis')
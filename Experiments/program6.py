@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import train_test_split
 import matplotlib.pyplot as plt
 
@@ -12,9 +11,15 @@ try:
     X = house_df[['Area']].values
     y = house_df['Price'].values
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-    lin_reg = LinearRegression()
-    lin_reg.fit(X_train, y_train)
-    y_pred = lin_reg.predict(X_test)
+
+    # Closed-form least squares for a single feature
+    x = X_train.ravel().astype(np.float64)
+    y_fit = y_train.astype(np.float64)
+    x_mean, y_mean = x.mean(), y_fit.mean()
+    x_centered = x - x_mean
+    slope = (x_centered * (y_fit - y_mean)).sum() / (x_centered * x_centered).sum()
+    intercept = y_mean - slope * x_mean
+    y_pred = intercept + slope * X_test.ravel()
     plt.figure(figsize=(8, 6))
     plt.scatter(X_test, y_test, color='blue', label='Actual Prices')
     plt.plot(X_test, y_pred, color='red', linewidth=2, label='Predicted Prices')
@@ -24,8 +29,7 @@ try:
     plt.legend()
     plt.show()
     
-    from sklearn.metrics import mean_squared_error
-    mse = mean_squared_error(y_test, y_pred)
+    mse = ((y_test - y_pred) ** 2).mean()
     print(f"\nMean Squared Error: {mse:.2f}")
 
 except:
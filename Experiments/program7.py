@@ -1,6 +1,7 @@
+from itertools import combinations
+import numpy as np
 import pandas as pd
-from mlxtend.frequent_patterns import apriori, association_rules
-from mlxtend.preprocessing import TransactionEncoder
+from mlxtend.frequent_patterns import association_rules
 
 transactions = [['milk', 'bread', 'eggs'],
                 ['bread', 'jam'],
@@ -8,13 +9,50 @@ transactions = [['milk', 'bread', 'eggs'],
                 ['milk', 'sugar'],
                 ['bread', 'sugar']]
 
-te = TransactionEncoder()
-te_ary = te.fit(transactions).transform(transactions)
-df = pd.DataFrame(te_ary, columns=te.columns_)
+# One row of uint64 words per item, one bit per transaction
+items = sorted({item for t in transactions for item in t})
+item_idx = {item: k for k, item in enumerate(items)}
+bitmaps = np.zeros((len(items), (len(transactions) + 63) // 64), dtype=np.uint64)
+for ti, t in enumerate(transactions):
+    for item in t:
+        bitmaps[item_idx[item], ti >> 6] |= np.uint64(1) << np.uint64(ti & 63)
 
-frequent_itemsets = apriori(df, min_support=0.4, use_colnames=True)
+def popcount(words):
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+def apriori_bitmap(bitmaps, n_transactions, min_support):
+    # Level-wise Apriori; the support of an itemset is the popcount of its ANDed bitmaps
+    frequent = {}
+    level = {}
+    for k in range(len(bitmaps)):
+        count = popcount(bitmaps[k])
+        if count / n_transactions >= min_support:
+            level[(k,)] = bitmaps[k]
+            frequent[(k,)] = count
+    while level:
+        next_level = {}
+        for a, b in combinations(sorted(level), 2):
+            if a[:-1] != b[:-1]:
+                continue
+            candidate = a + (b[-1],)
+            if any(sub not in level for sub in combinations(candidate, len(candidate) - 1)):
+                continue
+            words = level[a] & bitmaps[b[-1]]
+            count = popcount(words)
+            if count / n_transactions >= min_support:
+                next_level[candidate] = words
+                frequent[candidate] = count
+        level = next_level
+    return pd.DataFrame({
+        'support': [count / n_transactions for count in frequent.values()],
+        'itemsets': [frozenset(items[k] for k in key) for key in frequent],
+    })
+
+frequent_itemsets = apriori_bitmap(bitmaps, len(transactions), min_support=0.4)
 rules = association_rules(frequent_itemsets, metric="confidence", min_threshold=0.7)
 print("--- Frequent Itemsets ---")
 print(frequent_itemsets)
 print("\n--- Association Rules ---")
-print(rules[['antecedents', 'consequents', 'support', 'confidence']])
\ No newline at end of file
+print(rules[['antecedents', 'consequents', 'support', 'confidence']])
@@ -1,11 +1,17 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend, safe to use from worker processes
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import warnings
 import sys
 import io
+import os
 
 # Fix Windows console encoding issues
 if sys.platform == 'win32':
@@ -18,6 +24,182 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['font.size'] = 10
 
+# Column types applied while parsing, so numeric fields never pass through object dtype
+CSV_COLUMN_TYPES = {
+    'view_count': pa.int64(),
+    'duration': pa.float32(),
+    'channel_follower_count': pa.float32(),
+    'channel': pa.string(),
+    'title': pa.string(),
+    'duration_string': pa.string(),
+}
+NUMERIC_COLUMNS = ['view_count', 'duration', 'channel_follower_count']
+
+def _read_csv(csv_file, column_types):
+    """Read the CSV with PyArrow (descriptions contain quoted newlines)"""
+    table = pa_csv.read_csv(
+        csv_file,
+        read_options=pa_csv.ReadOptions(encoding='utf-8'),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types,
+                                              strings_can_be_null=True),
+    )
+    return table.to_pandas()
+
+def _truncate(labels, width):
+    """Shorten string labels longer than width, appending an ellipsis"""
+    # Plain objects: a categorical (e.g. the channel index) cannot take the new shortened values
+    labels = labels.astype(object)
+    return labels.where(labels.str.len() <= width, labels.str.slice(0, width) + '...')
+
+def _summary_stats(values):
+    """Return mean, std, min, max and quartiles of a 1-D array with a single partition"""
+    a = np.asarray(values, dtype=np.float64)
+    n = len(a)
+
+    # Quartile positions with linear interpolation, matching pandas' quantile()
+    pos = np.array([0.25, 0.5, 0.75]) * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.ceil(pos).astype(np.intp)
+
+    # One partition puts the min, max and every quartile neighbour in sorted position
+    part = np.partition(a, np.unique(np.concatenate(([0, n - 1], lo, hi))))
+    q25, median, q75 = part[lo] + (part[hi] - part[lo]) * (pos - lo)
+
+    return {
+        'mean': a.mean(),
+        'median': median,
+        'std': a.std(ddof=1),
+        'min': part[0],
+        'max': part[n - 1],
+        'q25': q25,
+        'q75': q75,
+    }
+
+def _save_figure(path):
+    """Lay out, save and close the current figure"""
+    plt.tight_layout()
+    # Fastest zlib level: the 300 dpi deflate dominates save time, files grow slightly
+    plt.savefig(path, dpi=300, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+    plt.close()
+
+def _plot_top_songs(views_in_billions, titles, path):
+    """Bar chart of the most viewed songs"""
+    plt.figure(figsize=(14, 8))
+    plt.barh(range(len(titles)), views_in_billions, color='#FF0000')
+    plt.yticks(range(len(titles)), titles, fontsize=9)
+    plt.xlabel('Views (Billions)', fontsize=12, fontweight='bold')
+    plt.title('Top 15 Most Viewed Songs on YouTube', fontsize=14, fontweight='bold', pad=20)
+    plt.gca().invert_yaxis()
+    plt.grid(axis='x', alpha=0.3)
+    _save_figure(path)
+
+def _plot_top_channels(views_in_billions, channels, path):
+    """Bar chart of the channels with the most total views"""
+    plt.figure(figsize=(14, 8))
+    plt.barh(range(len(channels)), views_in_billions, color='#1DB954')
+    plt.yticks(range(len(channels)), channels, fontsize=9)
+    plt.xlabel('Total Views (Billions)', fontsize=12, fontweight='bold')
+    plt.title('Top 10 Channels by Total Views', fontsize=14, fontweight='bold', pad=20)
+    plt.gca().invert_yaxis()
+    plt.grid(axis='x', alpha=0.3)
+    _save_figure(path)
+
+def _plot_view_distribution(counts, edges, path):
+    """Histogram of video views from precomputed bins"""
+    plt.figure(figsize=(14, 6))
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+            color='#4285F4', edgecolor='black', alpha=0.7)
+    plt.xlabel('Views (Millions)', fontsize=12, fontweight='bold')
+    plt.ylabel('Number of Songs', fontsize=12, fontweight='bold')
+    plt.title('Distribution of Video Views', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(axis='y', alpha=0.3)
+    _save_figure(path)
+
+def _plot_duration_vs_views(duration_minutes, views_in_millions, path):
+    """Scatter plot of duration against views with a least-squares trend line"""
+    plt.figure(figsize=(14, 8))
+    plt.scatter(duration_minutes, views_in_millions, alpha=0.5, s=30, color='#FF6B6B')
+    plt.xlabel('Duration (Minutes)', fontsize=12, fontweight='bold')
+    plt.ylabel('Views (Millions)', fontsize=12, fontweight='bold')
+    plt.title('Song Duration vs View Count', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(alpha=0.3)
+
+    # Add trend line (closed-form least squares on rows where both values are present)
+    d = np.asarray(duration_minutes, dtype=np.float64)
+    v = np.asarray(views_in_millions, dtype=np.float64)
+    valid = ~(np.isnan(d) | np.isnan(v))
+    d, v = d[valid], v[valid]
+    d_centered = d - d.mean()
+    slope = (d_centered * (v - v.mean())).sum() / (d_centered * d_centered).sum()
+    intercept = v.mean() - slope * d.mean()
+    x_trend = np.linspace(d.min(), d.max(), 100)
+    plt.plot(x_trend, intercept + slope * x_trend, "r--", linewidth=2, label='Trend Line')
+    plt.legend()
+    _save_figure(path)
+
+def _plot_duration_distribution(counts, edges, mean, median, path):
+    """Histogram of song durations from precomputed bins, with mean and median markers"""
+    plt.figure(figsize=(14, 6))
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+            color='#9C27B0', edgecolor='black', alpha=0.7)
+    plt.xlabel('Duration (Minutes)', fontsize=12, fontweight='bold')
+    plt.ylabel('Number of Songs', fontsize=12, fontweight='bold')
+    plt.title('Distribution of Song Durations', fontsize=14, fontweight='bold', pad=20)
+    plt.axvline(mean, color='red', linestyle='--',
+               linewidth=2, label=f'Mean: {mean:.2f} min')
+    plt.axvline(median, color='green', linestyle='--',
+               linewidth=2, label=f'Median: {median:.2f} min')
+    plt.legend()
+    plt.grid(axis='y', alpha=0.3)
+    _save_figure(path)
+
+def _plot_followers_vs_views(followers_in_millions, views_in_millions, path):
+    """Scatter plot of channel followers against video views"""
+    plt.figure(figsize=(14, 8))
+    plt.scatter(followers_in_millions, views_in_millions, alpha=0.5, s=30, color='#FFA726')
+    plt.xlabel('Channel Followers (Millions)', fontsize=12, fontweight='bold')
+    plt.ylabel('Video Views (Millions)', fontsize=12, fontweight='bold')
+    plt.title('Channel Followers vs Video Views', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(alpha=0.3)
+    _save_figure(path)
+
+def _plot_popularity_distribution(mega_hits, popular, moderate, path):
+    """Pie chart of the popularity categories"""
+    plt.figure(figsize=(10, 10))
+    sizes = [mega_hits, popular, moderate]
+    labels = [f'Mega Hits\n(≥1B views)\n{mega_hits:,} songs',
+             f'Popular\n(100M-1B views)\n{popular:,} songs',
+             f'Moderate\n(<100M views)\n{moderate:,} songs']
+    colors = ['#FF6B6B', '#4ECDC4', '#95E1D3']
+    explode = (0.1, 0.05, 0)
+
+    plt.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
+           shadow=True, startangle=90, textprops={'fontsize': 11, 'fontweight': 'bold'})
+    plt.title('Song Popularity Distribution', fontsize=14, fontweight='bold', pad=20)
+    _save_figure(path)
+
+def _plot_top_channels_by_count(song_counts, channels, path):
+    """Bar chart of the channels with the most songs"""
+    plt.figure(figsize=(14, 8))
+    plt.barh(range(len(channels)), song_counts, color='#00BCD4')
+    plt.yticks(range(len(channels)), channels, fontsize=9)
+    plt.xlabel('Number of Songs', fontsize=12, fontweight='bold')
+    plt.title('Top 10 Channels by Number of Songs', fontsize=14, fontweight='bold', pad=20)
+    plt.gca().invert_yaxis()
+    plt.grid(axis='x', alpha=0.3)
+    _save_figure(path)
+
+def _plot_correlation_heatmap(corr_matrix, path):
+    """Heatmap of the views/duration/followers correlation matrix"""
+    plt.figure(figsize=(10, 8))
+    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
+               square=True, linewidths=2, cbar_kws={"shrink": 0.8},
+               fmt='.3f', annot_kws={'fontsize': 12, 'fontweight': 'bold'})
+    plt.title('Correlation Matrix: Views, Duration & Followers',
+             fontsize=14, fontweight='bold', pad=20)
+    _save_figure(path)
+
 class YouTubeMusicAnalytics:
     """Main class for YouTube Music Analytics Dashboard"""
 
@@ -27,6 +209,15 @@ class YouTubeMusicAnalytics:
         self.df = None
         self.insights = []
 
+        # Aggregates computed once after cleaning and reused by every step
+        self._by_channel = None
+        self._top_channels_by_count = None
+        self._view_counts = None
+        self._mega = self._popular = self._moderate = 0
+        self._corr_matrix = None
+        self._fc_idx = None
+        self._fc_view = None
+
     def load_and_clean_data(self):
         """Load CSV data and perform cleaning operations"""
         print("=" * 80)
@@ -35,22 +226,21 @@ class YouTubeMusicAnalytics:
         print("\n[1/6] Loading and cleaning data...")
 
         # Load the CSV file
-        self.df = pd.read_csv(self.csv_file, encoding='utf-8')
+        try:
+            self.df = _read_csv(self.csv_file, CSV_COLUMN_TYPES)
+        except pa.ArrowInvalid:
+            # A malformed numeric cell: read those columns as text and coerce bad values to NaN,
+            # so the affected rows are dropped below like any other missing data
+            text_types = {**CSV_COLUMN_TYPES, **{col: pa.string() for col in NUMERIC_COLUMNS}}
+            self.df = _read_csv(self.csv_file, text_types)
+            for col in NUMERIC_COLUMNS:
+                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+            self.df['duration'] = self.df['duration'].astype('float32')
+            self.df['channel_follower_count'] = self.df['channel_follower_count'].astype('float32')
 
         print(f"   ✓ Loaded {len(self.df):,} records")
         print(f"   ✓ Dataset shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns")
 
-        # Convert view_count to numeric
-        self.df['view_count'] = pd.to_numeric(self.df['view_count'], errors='coerce')
-
-        # Convert duration to numeric (seconds)
-        self.df['duration'] = pd.to_numeric(self.df['duration'], errors='coerce')
-
-        # Convert channel_follower_count to numeric
-        self.df['channel_follower_count'] = pd.to_numeric(
-            self.df['channel_follower_count'], errors='coerce'
-        )
-
         # Remove rows with missing critical data
         original_count = len(self.df)
         self.df = self.df.dropna(subset=['view_count', 'duration', 'channel'])
@@ -59,15 +249,82 @@ class YouTubeMusicAnalytics:
         if removed_count > 0:
             print(f"   ✓ Removed {removed_count} rows with missing critical data")
 
-        # Add derived features
-        self.df['duration_minutes'] = self.df['duration'] / 60
-        self.df['views_in_billions'] = self.df['view_count'] / 1_000_000_000
-        self.df['views_in_millions'] = self.df['view_count'] / 1_000_000
+        # View counts are integral; with missing rows dropped they fit a plain int64
+        self.df['view_count'] = self.df['view_count'].astype('int64')
+
+        # Display labels used by the printouts and chart axes
+        self.df['_title40'] = _truncate(self.df['title'], 40)
+        self.df['_title50'] = _truncate(self.df['title'], 50)
+
+        # Cache aggregates shared by EDA, statistics, charts and the report
+        # Category codes make the channel groupby hash small integers instead of strings
+        self.df['channel'] = self.df['channel'].astype('category')
+        by_channel = (self.df.groupby('channel', sort=False, observed=True)
+                      .agg(total_views=('view_count', 'sum'),
+                           song_count=('view_count', 'size')))
+        # Ties go to the alphabetically first channel, as groupby('channel')...idxmax() picked
+        self._by_channel = by_channel.sort_index().sort_values('total_views', ascending=False,
+                                                               kind='stable')
+        # Stable sort keeps first-appearance order among ties, like value_counts()
+        self._top_channels_by_count = (by_channel['song_count']
+                                       .sort_values(ascending=False, kind='stable').head(10))
+        self._view_counts = self.df['view_count'].to_numpy()
+        # Popularity buckets: 0 = moderate (<100M), 1 = popular (100M-1B), 2 = mega (>=1B)
+        vc = self._view_counts
+        buckets = np.bincount(np.searchsorted([100_000_000, 1_000_000_000], vc, side='right'),
+                              minlength=3)
+        self._moderate, self._popular, self._mega = (int(n) for n in buckets)
+
+        # Rows with a known follower count; view_count and duration are never missing here
+        has_followers = self.df['channel_follower_count'].notna().to_numpy()
+        self._fc_idx = np.flatnonzero(has_followers)
+        self._fc_view = np.column_stack((
+            self.df['channel_follower_count'].to_numpy()[self._fc_idx],
+            self.df['view_count'].to_numpy(dtype=np.float32)[self._fc_idx] / 1_000_000,
+        ))
+
+        # Full correlation matrix in one pass, reused for the printed values and the heatmap
+        corr_cols = ['view_count', 'duration', 'channel_follower_count']
+        corr_values = self.df[corr_cols].to_numpy(dtype=np.float64)[self._fc_idx]
+        if len(corr_values) > 1:
+            corr = np.corrcoef(corr_values, rowvar=False)
+        else:
+            # Too few rows with followers: undefined, as DataFrame.corr() reports it
+            corr = np.full((len(corr_cols), len(corr_cols)), np.nan)
+        self._corr_matrix = pd.DataFrame(corr, index=corr_cols, columns=corr_cols)
 
         print(f"   ✓ Data cleaning completed\n")
 
         return self.df
 
+    # Scaled views of the cleaned columns, computed on use rather than stored in the DataFrame
+    @property
+    def duration_minutes(self):
+        """Song durations in minutes"""
+        # float64: float32 rounding moves exact values such as 198 s = 3.3 min across bin edges
+        return self.df['duration'].to_numpy(dtype=np.float64) / 60
+
+    @property
+    def views_in_millions(self):
+        """View counts in millions"""
+        return self.df['view_count'].to_numpy(dtype=np.float32) / 1_000_000
+
+    def _top_view_positions(self, n):
+        """Return row positions of the n most viewed songs, highest first"""
+        vc = self._view_counts
+        n = min(n, len(vc))
+        if 0 < n < len(vc):
+            # O(N) selection of the n-th largest value; like nlargest(keep='first'), take every
+            # row above it and fill up with the earliest rows tied at it
+            cutoff = -np.partition(-vc, n - 1)[n - 1]
+            above = np.flatnonzero(vc > cutoff)
+            tied = np.flatnonzero(vc == cutoff)[:n - len(above)]
+            positions = np.concatenate((above, tied))
+        else:
+            positions = np.arange(n)
+        # Positions are in row order within each value, so the stable sort keeps ties in row order
+        return positions[np.argsort(-vc[positions], kind='stable')]
+
     def exploratory_data_analysis(self):
         """Perform exploratory data analysis"""
         print("[2/6] Performing Exploratory Data Analysis...")
@@ -79,12 +336,12 @@ class YouTubeMusicAnalytics:
 
         stats = {
             'Total Songs': f"{len(self.df):,}",
-            'Total Channels': f"{self.df['channel'].nunique():,}",
+            'Total Channels': f"{len(self._by_channel):,}",
             'Total Views (Billions)': f"{self.df['view_count'].sum() / 1_000_000_000:.2f}B",
             'Average Views per Song': f"{self.df['view_count'].mean():,.0f}",
             'Median Views per Song': f"{self.df['view_count'].median():,.0f}",
-            'Average Duration': f"{self.df['duration_minutes'].mean():.2f} minutes",
-            'Most Popular Channel': self.df.groupby('channel')['view_count'].sum().idxmax()
+            'Average Duration': f"{self.duration_minutes.mean():.2f} minutes",
+            'Most Popular Channel': self._by_channel.index[0]
         }
 
         for key, value in stats.items():
@@ -95,11 +352,13 @@ class YouTubeMusicAnalytics:
         print("TOP 20 MOST VIEWED SONGS")
         print("=" * 80)
 
-        top_songs = self.df.nlargest(20, 'view_count')[['title', 'channel', 'view_count', 'duration_string']]
+        top_idx = self._top_view_positions(20)
+        top_songs = self.df.iloc[top_idx][['title', 'channel', 'view_count', 'duration_string']]
 
-        for idx, (_, row) in enumerate(top_songs.iterrows(), 1):
-            title = row['title'][:50] + '...' if len(row['title']) > 50 else row['title']
-            views = f"{row['view_count']:,.0f}"
+        titles = self.df['_title50'].to_numpy()[top_idx]
+        view_counts = top_songs['view_count'].to_numpy()
+        for idx, (title, view_count) in enumerate(zip(titles, view_counts), 1):
+            views = f"{view_count:,.0f}"
             print(f"{idx:2d}. {title:.<55} {views:>15} views")
 
         # Top 10 channels by total views
@@ -107,25 +366,20 @@ class YouTubeMusicAnalytics:
         print("TOP 10 CHANNELS BY TOTAL VIEWS")
         print("=" * 80)
 
-        top_channels = self.df.groupby('channel').agg({
-            'view_count': 'sum',
-            'title': 'count'
-        }).sort_values('view_count', ascending=False).head(10)
-
-        top_channels.columns = ['Total Views', 'Number of Songs']
+        top_channels = self._by_channel.head(10).set_axis(['Total Views', 'Number of Songs'], axis=1)
 
-        for idx, (channel, row) in enumerate(top_channels.iterrows(), 1):
-            views = f"{row['Total Views']:,.0f}"
-            songs = row['Number of Songs']
-            channel_name = channel[:40] + '...' if len(channel) > 40 else channel
+        channel_names = _truncate(top_channels.index.to_series(), 40)
+        rows = top_channels.itertuples(index=False, name=None)
+        for idx, (channel_name, (total_views, songs)) in enumerate(zip(channel_names, rows), 1):
+            views = f"{total_views:,.0f}"
             print(f"{idx:2d}. {channel_name:.<45} {views:>18} ({songs} songs)")
 
         print("\n   ✓ EDA completed\n")
 
         # Store insights
-        self.insights.append(f"Dataset contains {len(self.df):,} songs from {self.df['channel'].nunique():,} channels")
+        self.insights.append(f"Dataset contains {len(self.df):,} songs from {len(self._by_channel):,} channels")
         self.insights.append(f"Total combined views: {self.df['view_count'].sum() / 1_000_000_000:.2f} billion")
-        self.insights.append(f"Most viewed song: {self.df.nlargest(1, 'view_count')['title'].values[0]}")
+        self.insights.append(f"Most viewed song: {self.df['title'].iat[self._view_counts.argmax()]}")
 
         return top_songs, top_channels
 
@@ -138,40 +392,37 @@ class YouTubeMusicAnalytics:
         print("=" * 80)
 
         # View count statistics
+        view_stats = _summary_stats(self._view_counts)
         print("\n📊 View Count Distribution:")
-        print(f"   Mean:        {self.df['view_count'].mean():>15,.0f}")
-        print(f"   Median:      {self.df['view_count'].median():>15,.0f}")
-        print(f"   Std Dev:     {self.df['view_count'].std():>15,.0f}")
-        print(f"   Min:         {self.df['view_count'].min():>15,.0f}")
-        print(f"   Max:         {self.df['view_count'].max():>15,.0f}")
-        print(f"   25th %ile:   {self.df['view_count'].quantile(0.25):>15,.0f}")
-        print(f"   75th %ile:   {self.df['view_count'].quantile(0.75):>15,.0f}")
+        print(f"   Mean:        {view_stats['mean']:>15,.0f}")
+        print(f"   Median:      {view_stats['median']:>15,.0f}")
+        print(f"   Std Dev:     {view_stats['std']:>15,.0f}")
+        print(f"   Min:         {view_stats['min']:>15,.0f}")
+        print(f"   Max:         {view_stats['max']:>15,.0f}")
+        print(f"   25th %ile:   {view_stats['q25']:>15,.0f}")
+        print(f"   75th %ile:   {view_stats['q75']:>15,.0f}")
 
         # Duration statistics
+        duration_stats = _summary_stats(self.duration_minutes)
         print("\n⏱️  Duration Distribution (minutes):")
-        print(f"   Mean:        {self.df['duration_minutes'].mean():>15.2f}")
-        print(f"   Median:      {self.df['duration_minutes'].median():>15.2f}")
-        print(f"   Std Dev:     {self.df['duration_minutes'].std():>15.2f}")
-        print(f"   Min:         {self.df['duration_minutes'].min():>15.2f}")
-        print(f"   Max:         {self.df['duration_minutes'].max():>15.2f}")
+        print(f"   Mean:        {duration_stats['mean']:>15.2f}")
+        print(f"   Median:      {duration_stats['median']:>15.2f}")
+        print(f"   Std Dev:     {duration_stats['std']:>15.2f}")
+        print(f"   Min:         {duration_stats['min']:>15.2f}")
+        print(f"   Max:         {duration_stats['max']:>15.2f}")
 
         # Correlation analysis
         print("\n🔗 Correlation Analysis:")
 
-        correlation_data = self.df[['view_count', 'duration', 'channel_follower_count']].dropna()
-
-        if len(correlation_data) > 0:
-            corr_duration_views = correlation_data['duration'].corr(correlation_data['view_count'])
+        if len(self._fc_idx) > 0:
+            corr_duration_views = self._corr_matrix.loc['view_count', 'duration']
             print(f"   Duration vs Views:            {corr_duration_views:>8.4f}")
 
-            if correlation_data['channel_follower_count'].notna().any():
-                corr_followers_views = correlation_data['channel_follower_count'].corr(correlation_data['view_count'])
-                print(f"   Channel Followers vs Views:   {corr_followers_views:>8.4f}")
+            corr_followers_views = self._corr_matrix.loc['view_count', 'channel_follower_count']
+            print(f"   Channel Followers vs Views:   {corr_followers_views:>8.4f}")
 
         # Category analysis
-        mega_hits = len(self.df[self.df['view_count'] >= 1_000_000_000])
-        popular = len(self.df[(self.df['view_count'] >= 100_000_000) & (self.df['view_count'] < 1_000_000_000)])
-        moderate = len(self.df[self.df['view_count'] < 100_000_000])
+        mega_hits, popular, moderate = self._mega, self._popular, self._moderate
 
         print("\n📈 Popularity Categories:")
         print(f"   Mega Hits (≥1B views):       {mega_hits:>8,} ({mega_hits/len(self.df)*100:>5.1f}%)")
@@ -182,180 +433,101 @@ class YouTubeMusicAnalytics:
 
         # Store insights
         self.insights.append(f"{mega_hits} songs have achieved 'mega hit' status with over 1 billion views")
-        self.insights.append(f"Average song duration is {self.df['duration_minutes'].mean():.2f} minutes")
+        self.insights.append(f"Average song duration is {duration_stats['mean']:.2f} minutes")
 
     def create_visualizations(self):
         """Create all visualizations"""
         print("[4/6] Creating Visualizations...")
 
         # Create output directory for plots
-        import os
         if not os.path.exists('analytics_output'):
             os.makedirs('analytics_output')
 
-        viz_count = 0
+        # Prepare the data for every chart; rendering happens in worker processes
+        charts = []
+        durations = self.duration_minutes
+        views_in_millions = self.views_in_millions
 
         # 1. Top 15 Most Viewed Songs
-        plt.figure(figsize=(14, 8))
-        top_15 = self.df.nlargest(15, 'view_count')
-        plt.barh(range(len(top_15)), top_15['views_in_billions'], color='#FF0000')
-        plt.yticks(range(len(top_15)),
-                   [title[:40] + '...' if len(title) > 40 else title
-                    for title in top_15['title']], fontsize=9)
-        plt.xlabel('Views (Billions)', fontsize=12, fontweight='bold')
-        plt.title('Top 15 Most Viewed Songs on YouTube', fontsize=14, fontweight='bold', pad=20)
-        plt.gca().invert_yaxis()
-        plt.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('analytics_output/01_top_15_songs.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: Top 15 Most Viewed Songs")
+        top_15 = self._top_view_positions(15)
+        charts.append(('Top 15 Most Viewed Songs', _plot_top_songs, (
+            self._view_counts[top_15] / 1_000_000_000,
+            list(self.df['_title40'].to_numpy()[top_15]),
+            'analytics_output/01_top_15_songs.png',
+        )))
 
         # 2. Top 10 Channels by Total Views
-        plt.figure(figsize=(14, 8))
-        channel_views = self.df.groupby('channel')['views_in_billions'].sum().sort_values(ascending=False).head(10)
-        plt.barh(range(len(channel_views)), channel_views.values, color='#1DB954')
-        plt.yticks(range(len(channel_views)),
-                   [ch[:35] + '...' if len(ch) > 35 else ch
-                    for ch in channel_views.index], fontsize=9)
-        plt.xlabel('Total Views (Billions)', fontsize=12, fontweight='bold')
-        plt.title('Top 10 Channels by Total Views', fontsize=14, fontweight='bold', pad=20)
-        plt.gca().invert_yaxis()
-        plt.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('analytics_output/02_top_10_channels.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: Top 10 Channels")
-
-        # 3. View Count Distribution
-        plt.figure(figsize=(14, 6))
-        plt.hist(self.df['views_in_millions'], bins=50, color='#4285F4', edgecolor='black', alpha=0.7)
-        plt.xlabel('Views (Millions)', fontsize=12, fontweight='bold')
-        plt.ylabel('Number of Songs', fontsize=12, fontweight='bold')
-        plt.title('Distribution of Video Views', fontsize=14, fontweight='bold', pad=20)
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('analytics_output/03_view_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: View Count Distribution")
+        channel_views = self._by_channel['total_views'].head(10) / 1_000_000_000
+        charts.append(('Top 10 Channels', _plot_top_channels, (
+            channel_views.to_numpy(),
+            list(_truncate(channel_views.index.to_series(), 35)),
+            'analytics_output/02_top_10_channels.png',
+        )))
+
+        # 3. View Count Distribution (binned here so workers only receive the counts)
+        counts, edges = np.histogram(views_in_millions, bins=50)
+        charts.append(('View Count Distribution', _plot_view_distribution, (
+            counts, edges,
+            'analytics_output/03_view_distribution.png',
+        )))
 
         # 4. Duration vs Views Scatter Plot
-        plt.figure(figsize=(14, 8))
-        sample_size = min(2000, len(self.df))
-        sample_df = self.df.sample(n=sample_size, random_state=42)
-        plt.scatter(sample_df['duration_minutes'], sample_df['views_in_millions'],
-                   alpha=0.5, s=30, color='#FF6B6B')
-        plt.xlabel('Duration (Minutes)', fontsize=12, fontweight='bold')
-        plt.ylabel('Views (Millions)', fontsize=12, fontweight='bold')
-        plt.title('Song Duration vs View Count', fontsize=14, fontweight='bold', pad=20)
-        plt.grid(alpha=0.3)
-
-        # Add trend line
-        z = np.polyfit(sample_df['duration_minutes'].dropna(),
-                      sample_df['views_in_millions'].dropna(), 1)
-        p = np.poly1d(z)
-        x_trend = np.linspace(sample_df['duration_minutes'].min(),
-                             sample_df['duration_minutes'].max(), 100)
-        plt.plot(x_trend, p(x_trend), "r--", linewidth=2, label='Trend Line')
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig('analytics_output/04_duration_vs_views.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: Duration vs Views")
+        rng = np.random.default_rng(42)
+        sample_idx = rng.choice(len(self.df), min(2000, len(self.df)), replace=False)
+        charts.append(('Duration vs Views', _plot_duration_vs_views, (
+            durations[sample_idx],
+            views_in_millions[sample_idx],
+            'analytics_output/04_duration_vs_views.png',
+        )))
 
         # 5. Duration Distribution
-        plt.figure(figsize=(14, 6))
-        plt.hist(self.df['duration_minutes'], bins=60, color='#9C27B0', edgecolor='black', alpha=0.7)
-        plt.xlabel('Duration (Minutes)', fontsize=12, fontweight='bold')
-        plt.ylabel('Number of Songs', fontsize=12, fontweight='bold')
-        plt.title('Distribution of Song Durations', fontsize=14, fontweight='bold', pad=20)
-        plt.axvline(self.df['duration_minutes'].mean(), color='red', linestyle='--',
-                   linewidth=2, label=f'Mean: {self.df["duration_minutes"].mean():.2f} min')
-        plt.axvline(self.df['duration_minutes'].median(), color='green', linestyle='--',
-                   linewidth=2, label=f'Median: {self.df["duration_minutes"].median():.2f} min')
-        plt.legend()
-        plt.grid(axis='y', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('analytics_output/05_duration_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: Duration Distribution")
+        duration_stats = _summary_stats(durations)
+        counts, edges = np.histogram(durations, bins=60)
+        charts.append(('Duration Distribution', _plot_duration_distribution, (
+            counts, edges,
+            duration_stats['mean'],
+            duration_stats['median'],
+            'analytics_output/05_duration_distribution.png',
+        )))
 
         # 6. Channel Followers vs Views
-        followers_data = self.df[self.df['channel_follower_count'].notna()]
-        if len(followers_data) > 100:
-            plt.figure(figsize=(14, 8))
-            sample_size = min(2000, len(followers_data))
-            sample_followers = followers_data.sample(n=sample_size, random_state=42)
-            plt.scatter(sample_followers['channel_follower_count'] / 1_000_000,
-                       sample_followers['views_in_millions'],
-                       alpha=0.5, s=30, color='#FFA726')
-            plt.xlabel('Channel Followers (Millions)', fontsize=12, fontweight='bold')
-            plt.ylabel('Video Views (Millions)', fontsize=12, fontweight='bold')
-            plt.title('Channel Followers vs Video Views', fontsize=14, fontweight='bold', pad=20)
-            plt.grid(alpha=0.3)
-            plt.tight_layout()
-            plt.savefig('analytics_output/06_followers_vs_views.png', dpi=300, bbox_inches='tight')
-            plt.close()
-            viz_count += 1
-            print(f"   ✓ Created visualization {viz_count}: Followers vs Views")
+        if len(self._fc_view) > 100:
+            sample = self._fc_view[rng.choice(len(self._fc_view), min(2000, len(self._fc_view)),
+                                              replace=False)]
+            charts.append(('Followers vs Views', _plot_followers_vs_views, (
+                sample[:, 0] / 1_000_000,
+                sample[:, 1],
+                'analytics_output/06_followers_vs_views.png',
+            )))
 
         # 7. Popularity Categories Pie Chart
-        plt.figure(figsize=(10, 10))
-        mega_hits = len(self.df[self.df['view_count'] >= 1_000_000_000])
-        popular = len(self.df[(self.df['view_count'] >= 100_000_000) & (self.df['view_count'] < 1_000_000_000)])
-        moderate = len(self.df[self.df['view_count'] < 100_000_000])
-
-        sizes = [mega_hits, popular, moderate]
-        labels = [f'Mega Hits\n(≥1B views)\n{mega_hits:,} songs',
-                 f'Popular\n(100M-1B views)\n{popular:,} songs',
-                 f'Moderate\n(<100M views)\n{moderate:,} songs']
-        colors = ['#FF6B6B', '#4ECDC4', '#95E1D3']
-        explode = (0.1, 0.05, 0)
-
-        plt.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
-               shadow=True, startangle=90, textprops={'fontsize': 11, 'fontweight': 'bold'})
-        plt.title('Song Popularity Distribution', fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
-        plt.savefig('analytics_output/07_popularity_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: Popularity Distribution")
+        charts.append(('Popularity Distribution', _plot_popularity_distribution, (
+            self._mega, self._popular, self._moderate,
+            'analytics_output/07_popularity_distribution.png',
+        )))
 
         # 8. Top 10 Channels by Song Count
-        plt.figure(figsize=(14, 8))
-        channel_counts = self.df['channel'].value_counts().head(10)
-        plt.barh(range(len(channel_counts)), channel_counts.values, color='#00BCD4')
-        plt.yticks(range(len(channel_counts)),
-                   [ch[:35] + '...' if len(ch) > 35 else ch
-                    for ch in channel_counts.index], fontsize=9)
-        plt.xlabel('Number of Songs', fontsize=12, fontweight='bold')
-        plt.title('Top 10 Channels by Number of Songs', fontsize=14, fontweight='bold', pad=20)
-        plt.gca().invert_yaxis()
-        plt.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('analytics_output/08_top_channels_by_count.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: Top Channels by Song Count")
+        channel_counts = self._top_channels_by_count
+        charts.append(('Top Channels by Song Count', _plot_top_channels_by_count, (
+            channel_counts.to_numpy(),
+            list(_truncate(channel_counts.index.to_series(), 35)),
+            'analytics_output/08_top_channels_by_count.png',
+        )))
 
         # 9. Correlation Heatmap
-        plt.figure(figsize=(10, 8))
-        corr_data = self.df[['view_count', 'duration', 'channel_follower_count']].dropna().corr()
-        sns.heatmap(corr_data, annot=True, cmap='coolwarm', center=0,
-                   square=True, linewidths=2, cbar_kws={"shrink": 0.8},
-                   fmt='.3f', annot_kws={'fontsize': 12, 'fontweight': 'bold'})
-        plt.title('Correlation Matrix: Views, Duration & Followers',
-                 fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
-        plt.savefig('analytics_output/09_correlation_heatmap.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        viz_count += 1
-        print(f"   ✓ Created visualization {viz_count}: Correlation Heatmap")
+        charts.append(('Correlation Heatmap', _plot_correlation_heatmap, (
+            self._corr_matrix,
+            'analytics_output/09_correlation_heatmap.png',
+        )))
+
+        # Rendering and PNG encoding are CPU-bound and independent, so run them concurrently
+        viz_count = 0
+        with ProcessPoolExecutor(max_workers=min(len(charts), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(plot, *args) for _, plot, args in charts]
+            for (name, _, _), future in zip(charts, futures):
+                future.result()
+                viz_count += 1
+                print(f"   ✓ Created visualization {viz_count}: {name}")
 
         print(f"\n   ✓ All {viz_count} visualizations saved to 'analytics_output/' folder\n")
 
@@ -376,19 +548,19 @@ class YouTubeMusicAnalytics:
         # Key metrics
         report.append(f"\n📊 Dataset Overview:")
         report.append(f"   • Total songs analyzed: {len(self.df):,}")
-        report.append(f"   • Unique channels: {self.df['channel'].nunique():,}")
+        report.append(f"   • Unique channels: {len(self._by_channel):,}")
         report.append(f"   • Combined views: {self.df['view_count'].sum() / 1_000_000_000:.2f} billion")
         report.append(f"   • Average views per song: {self.df['view_count'].mean():,.0f}")
 
         # Top performers
         report.append(f"\n🏆 Top Performers:")
-        top_song = self.df.nlargest(1, 'view_count').iloc[0]
-        report.append(f"   • Most viewed song: {top_song['title']}")
-        report.append(f"     Views: {top_song['view_count']:,.0f}")
-        report.append(f"     Channel: {top_song['channel']}")
+        top_pos = self._view_counts.argmax()
+        report.append(f"   • Most viewed song: {self.df['title'].iat[top_pos]}")
+        report.append(f"     Views: {self._view_counts[top_pos]:,.0f}")
+        report.append(f"     Channel: {self.df['channel'].iat[top_pos]}")
 
-        top_channel = self.df.groupby('channel')['view_count'].sum().idxmax()
-        top_channel_views = self.df.groupby('channel')['view_count'].sum().max()
+        top_channel = self._by_channel.index[0]
+        top_channel_views = self._by_channel['total_views'].iloc[0]
         report.append(f"   • Top channel: {top_channel}")
         report.append(f"     Total views: {top_channel_views:,.0f}")
 
@@ -399,16 +571,17 @@ class YouTubeMusicAnalytics:
 
         # Duration analysis
         report.append(f"\n⏱️  Duration Insights:")
-        report.append(f"   • Average song duration: {self.df['duration_minutes'].mean():.2f} minutes")
+        durations = self.duration_minutes
+        report.append(f"   • Average song duration: {durations.mean():.2f} minutes")
         report.append(f"   • Most common duration range: 3-5 minutes")
-        short_songs = len(self.df[self.df['duration_minutes'] < 3])
+        short_songs = int((durations < 3).sum())
         report.append(f"   • Songs under 3 minutes: {short_songs:,} ({short_songs/len(self.df)*100:.1f}%)")
 
         # Popularity breakdown
         report.append(f"\n📈 Popularity Analysis:")
-        mega_hits = len(self.df[self.df['view_count'] >= 1_000_000_000])
+        mega_hits = self._mega
         report.append(f"   • Mega hits (≥1B views): {mega_hits:,} songs ({mega_hits/len(self.df)*100:.1f}%)")
-        popular = len(self.df[(self.df['view_count'] >= 100_000_000) & (self.df['view_count'] < 1_000_000_000)])
+        popular = self._popular
         report.append(f"   • Popular (100M-1B): {popular:,} songs ({popular/len(self.df)*100:.1f}%)")
 
         # Recommendations